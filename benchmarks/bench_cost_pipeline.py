@@ -0,0 +1,391 @@
+"""
+Cost pipeline benchmark suite.
+
+    PYTHONPATH=src python benchmarks/bench_cost_pipeline.py \
+        --sizes 10000 100000 1000000 --output bench_results/$(git rev-parse --short HEAD).json
+
+    PYTHONPATH=src python benchmarks/bench_cost_pipeline.py --compare old.json new.json
+
+Pass --sizes ... 10000000 for the 10^7 tier (needs several GB of RAM,
+since CostAggregator keeps every record).
+"""
+import argparse
+import gc
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from finops.billing_export_importer import BillingExportImporter
+from finops.cost_aggregator import CostAggregator
+from finops.cost_event_codec import encode_batch, encode_json_batch, feed_aggregator
+from finops.k8s_cost_collector import K8sCostCollector
+from finops.streaming_cost_ingestor import StreamingCostIngestor
+from utils.logger import JsonFormatter
+
+from synthetic_workload import SyntheticCostWorkload, write_cur_export
+
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+# Minimum line items/sec per worker core for BillingExportImporter.import_files
+# on an IMPORT_FILES-file batch, checked by bench_billing_import.
+IMPORT_FILES = 4
+IMPORT_TARGET_LINE_ITEMS_PER_SEC = {"csv": 200_000, "gzip": 175_000}
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def _latency_stats(samples_ns: List[int]) -> Dict:
+    return {
+        "samples": len(samples_ns),
+        "p50_ms": round(_percentile(samples_ns, 50) / 1e6, 4),
+        "p99_ms": round(_percentile(samples_ns, 99) / 1e6, 4),
+    }
+
+
+def _throughput(count: int, elapsed_sec: float) -> float:
+    return round(count / elapsed_sec, 1) if elapsed_sec > 0 else float("inf")
+
+
+def bench_aggregator(events: List[Dict], summary_samples: int) -> Dict:
+    agg = CostAggregator(job_budget_usd=1e9, anomaly_threshold_pct=150, cost_center="BENCH")
+    history: List[float] = []
+    every = max(1, len(events) // summary_samples)
+    add_ns = 0
+    latencies: List[int] = []
+
+    # Time each run of add_cost calls between summary samples as a whole,
+    # so the timer itself is not what gets measured.
+    add_cost = agg.add_cost
+    for start in range(0, len(events), every):
+        segment = events[start:start + every]
+        t0 = time.perf_counter_ns()
+        for event in segment:
+            add_cost(event)
+        add_ns += time.perf_counter_ns() - t0
+
+        if len(segment) == every:
+            t0 = time.perf_counter_ns()
+            summary = agg.executive_summary(history)
+            latencies.append(time.perf_counter_ns() - t0)
+            history.append(summary["total_cost_usd"])
+
+    return {
+        "records": len(events),
+        "events_per_sec": _throughput(len(events), add_ns / 1e9),
+        "summary_latency": _latency_stats(latencies),
+    }
+
+
+def bench_streaming(events: List[Dict], cap: int) -> Dict:
+    # ingest_event recomputes the full summary per event (O(n) each), so
+    # this component is capped to keep the run finite.
+    events = events[:cap]
+    ingestor = StreamingCostIngestor(job_budget_usd=1e9, anomaly_threshold_pct=150, cost_center="BENCH")
+    latencies: List[int] = []
+
+    start = time.perf_counter()
+    for event in events:
+        t0 = time.perf_counter_ns()
+        ingestor.ingest_event(event)
+        latencies.append(time.perf_counter_ns() - t0)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "records": len(events),
+        "events_per_sec": _throughput(len(events), elapsed),
+        "ingest_latency": _latency_stats(latencies),
+    }
+
+
+def bench_k8s_collector(events: List[Dict], cap: int) -> Dict:
+    k8s = [e for e in events if e["platform"] == "kubernetes"][:cap]
+    collector = K8sCostCollector()
+
+    start = time.perf_counter()
+    for e in k8s:
+        collector.estimate_job_cost(e["job_id"], e["namespace"], e["cpu_core_hours"], e["memory_gb_hours"])
+    elapsed = time.perf_counter() - start
+
+    return {"records": len(k8s), "events_per_sec": _throughput(len(k8s), elapsed)}
+
+
+def bench_json_formatter(events: List[Dict], cap: int) -> Dict:
+    events = events[:cap]
+    formatter = JsonFormatter("bench-job", "bench", "run", "trace", "span")
+    total_bytes = 0
+
+    start = time.perf_counter()
+    for e in events:
+        record = logging.LogRecord("bench", logging.INFO, __file__, 0, "cost event", None, None)
+        record.metrics = e
+        total_bytes += len(formatter.format(record))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "records": len(events),
+        "events_per_sec": _throughput(len(events), elapsed),
+        "bytes_per_record": round(total_bytes / len(events), 1) if events else 0,
+    }
+
+
+def bench_codec(events: List[Dict], cap: int, batch_size: int = 10_000) -> Dict:
+    # The wire format carries collector-shaped events; drop the generator's event_id.
+    events = [{k: v for k, v in e.items() if k != "event_id"} for e in events[:cap]]
+    batches = [events[i:i + batch_size] for i in range(0, len(events), batch_size)]
+
+    start = time.perf_counter()
+    payloads = [encode_batch(b) for b in batches]
+    encode_elapsed = time.perf_counter() - start
+
+    agg = CostAggregator(job_budget_usd=None, anomaly_threshold_pct=150, cost_center="BENCH")
+    start = time.perf_counter()
+    for payload in payloads:
+        feed_aggregator(payload, agg)
+    feed_elapsed = time.perf_counter() - start
+
+    binary_bytes = sum(len(p) for p in payloads)
+    json_bytes = sum(len(encode_json_batch(b)) for b in batches)
+    return {
+        "records": len(events),
+        "encode_events_per_sec": _throughput(len(events), encode_elapsed),
+        "feed_events_per_sec": _throughput(len(events), feed_elapsed),
+        "binary_bytes_per_record": round(binary_bytes / len(events), 1) if events else 0,
+        "json_bytes_per_record": round(json_bytes / len(events), 1) if events else 0,
+    }
+
+
+def bench_billing_import(rows: int, seed: int, files: int = IMPORT_FILES) -> Dict:
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for kind, compress in (("csv", False), ("gzip", True)):
+            paths = []
+            for i in range(files):
+                path = os.path.join(tmp, f"cur-{i}.{kind}")
+                write_cur_export(path, SyntheticCostWorkload(seed=seed + i), rows // files, compress=compress)
+                paths.append(path)
+
+            agg = CostAggregator(job_budget_usd=None, anomaly_threshold_pct=150, cost_center="BENCH")
+            stats = BillingExportImporter(max_workers=files).import_files(paths, agg)
+            line_items = stats["line_items"]
+            rate = stats["line_items_per_sec"] or 0.0
+            per_core_rate = rate / min(files, os.cpu_count() or 1)
+            results[kind] = {
+                "records": line_items,
+                "events_per_sec": rate,
+                "bytes_per_record": (
+                    round(sum(os.path.getsize(p) for p in paths) / line_items, 1) if line_items else 0
+                ),
+                "meets_target": per_core_rate >= IMPORT_TARGET_LINE_ITEMS_PER_SEC[kind],
+            }
+    return results
+
+
+def measure_bytes_per_record(workload: SyntheticCostWorkload, count: int) -> Dict:
+    """
+    Traced heap growth of materialising `count` events and holding them
+    in a CostAggregator, divided by `count`.
+    """
+    gc.collect()
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+
+    agg = CostAggregator(job_budget_usd=None, anomaly_threshold_pct=150, cost_center="BENCH")
+    for event in workload.events(count):
+        agg.add_cost(event)
+
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "records": count,
+        "bytes_per_record": round((current - base) / count, 1),
+        "peak_bytes": peak - base,
+    }
+
+
+def _timed(name: str, fn: Callable[[], Dict]) -> Dict:
+    t0 = time.perf_counter()
+    result = fn()
+    print(f"  {name:<22} {time.perf_counter() - t0:8.2f}s  {result}", file=sys.stderr)
+    return result
+
+
+def run_suite(
+    sizes: List[int],
+    seed: int,
+    summary_samples: int,
+    component_cap: int,
+    streaming_cap: int,
+    memory_cap: int,
+    import_rows: int,
+) -> Dict:
+    results = []
+    for size in sizes:
+        print(f"size={size}", file=sys.stderr)
+        workload = SyntheticCostWorkload(seed=seed)
+
+        t0 = time.perf_counter()
+        events = list(workload.events(size))
+        gen_elapsed = time.perf_counter() - t0
+
+        results.append(
+            {
+                "size": size,
+                "workload": {
+                    "generate_events_per_sec": _throughput(size, gen_elapsed),
+                    "late_events": workload.late_events,
+                    "duplicate_events": workload.duplicate_events,
+                },
+                "cost_aggregator": _timed("cost_aggregator", lambda: bench_aggregator(events, summary_samples)),
+                "streaming_ingestor": _timed("streaming_ingestor", lambda: bench_streaming(events, streaming_cap)),
+                "k8s_collector": _timed("k8s_collector", lambda: bench_k8s_collector(events, component_cap)),
+                "json_formatter": _timed("json_formatter", lambda: bench_json_formatter(events, component_cap)),
+                "wire_codec": _timed("wire_codec", lambda: bench_codec(events, component_cap)),
+                "memory": _timed(
+                    "memory",
+                    lambda: measure_bytes_per_record(SyntheticCostWorkload(seed=seed), min(size, memory_cap)),
+                ),
+            }
+        )
+        del events
+        gc.collect()
+
+    report = {"meta": _meta(seed), "results": results}
+    if import_rows:
+        print(f"billing_import rows={import_rows}", file=sys.stderr)
+        report["billing_import"] = _timed("billing_import", lambda: bench_billing_import(import_rows, seed))
+    return report
+
+
+def _meta(seed: int) -> Dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "seed": seed,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": int(time.time()),
+    }
+
+
+def _flatten(prefix: str, value, out: Dict[str, float]):
+    if isinstance(value, dict):
+        for k, v in value.items():
+            _flatten(f"{prefix}.{k}" if prefix else k, v, out)
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        out[prefix] = value
+
+
+def missed_import_targets(report: Dict) -> List[str]:
+    return [
+        kind
+        for kind, result in (report.get("billing_import") or {}).items()
+        if not result.get("meets_target", True)
+    ]
+
+
+def compare(old_path: str, new_path: str, threshold_pct: float = 10.0) -> int:
+    """
+    Print per-metric change between two result files. Returns the number
+    of throughput / latency / memory metrics that regressed beyond
+    threshold_pct, plus one per missed billing import target in NEW.
+    """
+    with open(old_path) as f:
+        old = json.load(f)
+    with open(new_path) as f:
+        new = json.load(f)
+
+    old_by_size = {r["size"]: r for r in old["results"]}
+    pairs = [(f"size={r['size']}", old_by_size.get(r["size"]), r) for r in new["results"]]
+    pairs.append(("billing_import", old.get("billing_import"), new.get("billing_import")))
+
+    regressions = 0
+    for label, base, result in pairs:
+        if not base or not result:
+            continue
+
+        old_flat: Dict[str, float] = {}
+        new_flat: Dict[str, float] = {}
+        _flatten("", base, old_flat)
+        _flatten("", result, new_flat)
+
+        for key, new_value in sorted(new_flat.items()):
+            old_value = old_flat.get(key)
+            if not old_value or key == "size" or key.endswith(("records", "samples", "_events")):
+                continue
+            change = (new_value - old_value) / old_value * 100
+            higher_is_better = key.endswith("per_sec")
+            regressed = -change > threshold_pct if higher_is_better else change > threshold_pct
+            regressions += regressed
+            flag = "  REGRESSION" if regressed else ""
+            print(f"{label:<15} {key:<45} {old_value:>14} -> {new_value:>14} ({change:+.1f}%){flag}")
+
+    for kind in missed_import_targets(new):
+        regressions += 1
+        print(f"{'billing_import':<15} {kind + '.meets_target':<45} below IMPORT_TARGET_LINE_ITEMS_PER_SEC  REGRESSION")
+
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="FinOps cost pipeline benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--summary-samples", type=int, default=50)
+    parser.add_argument("--component-cap", type=int, default=1_000_000)
+    parser.add_argument("--streaming-cap", type=int, default=20_000)
+    parser.add_argument("--memory-cap", type=int, default=100_000)
+    parser.add_argument("--import-rows", type=int, default=1_000_000, help="0 skips the billing import bench")
+    parser.add_argument("--output", help="write results JSON here (default: stdout)")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"))
+    parser.add_argument("--threshold-pct", type=float, default=10.0)
+    args = parser.parse_args(argv)
+    if 0 < args.import_rows < IMPORT_FILES:
+        parser.error(f"--import-rows must be 0 or at least {IMPORT_FILES} (one row per import file)")
+
+    if args.compare:
+        return 1 if compare(*args.compare, threshold_pct=args.threshold_pct) else 0
+
+    report = run_suite(
+        sizes=args.sizes,
+        seed=args.seed,
+        summary_samples=args.summary_samples,
+        component_cap=args.component_cap,
+        streaming_cap=args.streaming_cap,
+        memory_cap=args.memory_cap,
+        import_rows=args.import_rows,
+    )
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w") as f:
+            f.write(payload + "\n")
+    else:
+        print(payload)
+
+    missed = missed_import_targets(report)
+    if missed:
+        print(f"Billing import below IMPORT_TARGET_LINE_ITEMS_PER_SEC for: {', '.join(missed)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+import csv
+import gzip
+import random
+from typing import Dict, Iterator, List
+
+
+# Rough platform mix of a large data platform: Kubernetes and Databricks
+# dominate event volume, warehouses and Azure are a long tail.
+PLATFORM_WEIGHTS = {
+    "kubernetes": 0.40,
+    "databricks": 0.25,
+    "snowflake": 0.12,
+    "bigquery": 0.08,
+    "aws": 0.06,
+    "redshift": 0.04,
+    "azure_synapse_spark": 0.03,
+    "fabric": 0.02,
+}
+
+NAMESPACES = ["etl", "ml", "analytics", "streaming", "reporting", "adhoc"]
+COST_CENTERS = ["SBE", "ADS", "FIN", "OPS", "R&D"]
+
+
+class SyntheticCostWorkload:
+    """
+    Seeded generator of realistic multi-platform cost events.
+
+    Events use the same dict shape the collectors emit. job_ids follow a
+    Zipf-like skew (a few hot jobs, a long tail), a fraction of events
+    arrive late (timestamp in the past) and a fraction are exact
+    duplicates of an earlier event.
+    """
+
+    def __init__(
+        self,
+        seed: int = 42,
+        num_jobs: int = 5_000,
+        late_pct: float = 2.0,
+        duplicate_pct: float = 1.0,
+        max_lateness_sec: int = 6 * 3600,
+        start_ts: int = 1_767_225_600,
+    ):
+        self.seed = seed
+        self.num_jobs = num_jobs
+        self.late_pct = late_pct
+        self.duplicate_pct = duplicate_pct
+        self.max_lateness_sec = max_lateness_sec
+        self.start_ts = start_ts
+
+        self.job_ids = [f"job-{i:05d}" for i in range(num_jobs)]
+        self._job_weights = [1.0 / (rank + 1) for rank in range(num_jobs)]
+        self._job_attrs = {
+            job_id: (NAMESPACES[i % len(NAMESPACES)], COST_CENTERS[i % len(COST_CENTERS)])
+            for i, job_id in enumerate(self.job_ids)
+        }
+        self._platforms = list(PLATFORM_WEIGHTS)
+        self._platform_weights = list(PLATFORM_WEIGHTS.values())
+
+        self.late_events = 0
+        self.duplicate_events = 0
+
+    def events(self, count: int) -> Iterator[Dict]:
+        rng = random.Random(self.seed)
+        self.late_events = 0
+        self.duplicate_events = 0
+
+        # Draw job / platform choices in blocks: random.choices with
+        # cum_weights is much cheaper per item than one call per event.
+        job_cum = _cumulative(self._job_weights)
+        platform_cum = _cumulative(self._platform_weights)
+        block = 10_000
+
+        recent: List[Dict] = []
+        emitted = 0
+        ts = self.start_ts
+        while emitted < count:
+            n = min(block, count - emitted)
+            jobs = rng.choices(self.job_ids, cum_weights=job_cum, k=n)
+            platforms = rng.choices(self._platforms, cum_weights=platform_cum, k=n)
+
+            for job_id, platform in zip(jobs, platforms):
+                if recent and rng.random() * 100 < self.duplicate_pct:
+                    self.duplicate_events += 1
+                    event = dict(rng.choice(recent))
+                else:
+                    ts += rng.randint(0, 2)
+                    event = self._event(rng, emitted, job_id, platform, ts)
+                    if rng.random() * 100 < self.late_pct:
+                        self.late_events += 1
+                        event["timestamp"] -= rng.randint(60, self.max_lateness_sec)
+
+                    if len(recent) < 1_000:
+                        recent.append(event)
+                    else:
+                        recent[rng.randrange(1_000)] = event
+
+                yield event
+                emitted += 1
+
+    def _event(self, rng: random.Random, seq: int, job_id: str, platform: str, ts: int) -> Dict:
+        # Lognormal cost: most events are cents, a few are tens of dollars.
+        cost = round(rng.lognormvariate(-2.0, 1.5), 4)
+        namespace, cost_center = self._job_attrs[job_id]
+        event = {
+            "event_id": f"{self.seed}-{seq}",
+            "platform": platform,
+            "job_id": job_id,
+            "namespace": namespace,
+            "cost_center": cost_center,
+            "estimated_cost_usd": cost,
+            "timestamp": ts,
+        }
+        if platform == "kubernetes":
+            event["cpu_core_hours"] = round(cost / 0.031611 * 0.8, 4)
+            event["memory_gb_hours"] = round(cost / 0.004237 * 0.2, 4)
+        return event
+
+
+# Synthetic platform -> CUR lineItem/ProductCode, for billing export files.
+CUR_PRODUCT_CODES = {
+    "kubernetes": "AmazonEKS",
+    "redshift": "AmazonRedshift",
+    "databricks": "AmazonEC2",
+    "aws": "AmazonS3",
+}
+
+CUR_HEADER = [
+    "identity/LineItemId",
+    "lineItem/UsageStartDate",
+    "lineItem/LineItemType",
+    "lineItem/ProductCode",
+    "lineItem/UnblendedCost",
+    "resourceTags/user:app",
+]
+
+
+def write_cur_export(path: str, workload: SyntheticCostWorkload, rows: int, compress: bool = False):
+    """
+    Write a CUR-style line-item CSV (gzip if compress) built from the
+    workload's events. Platforms without an AWS product code become EC2.
+    """
+    opener = gzip.open if compress else open
+    with opener(path, "wt", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(CUR_HEADER)
+        for event in workload.events(rows):
+            writer.writerow(
+                [
+                    event["event_id"],
+                    event["timestamp"],
+                    "Usage",
+                    CUR_PRODUCT_CODES.get(event["platform"], "AmazonEC2"),
+                    event["estimated_cost_usd"],
+                    event["job_id"],
+                ]
+            )
+
+
+def _cumulative(weights):
+    total = 0.0
+    out = []
+    for w in weights:
+        total += w
+        out.append(total)
+    return out
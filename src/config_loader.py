@@ -152,5 +152,7 @@ class ConfigLoader:
     def get_anomaly_threshold_pct(self): return self._config.get("finops", {}).get("anomaly_threshold_pct", 200)
     def get_cloud_provider(self): return self._config.get("finops", {}).get("cloud", "aws")
     def get_cost_center(self): return self._config.get("job", {}).get("cost_center")
+    def get_k8s_namespace(self): return self._config.get("job", {}).get("namespace", self.get_env())
+    def get_self_metering_interval_sec(self): return self._config.get("finops", {}).get("self_metering_interval_sec", 5.0)
     def get_active_experiment(self): return self._config.get("_active_experiment")
     def is_feature_enabled(self, name): return bool(self._config.get(name))
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Dict
 import random
 
@@ -45,3 +46,21 @@ class AzureCostManagementClient:
         resource_group: str,
     ) -> float:
         return round(random.uniform(20, 60), 2)
+
+
+BILLING_CLIENTS = {
+    "aws": AWSCostExplorerClient,
+    "gcp": GCPBillingClient,
+    "azure": AzureCostManagementClient,
+}
+
+
+@lru_cache(maxsize=None)
+def get_billing_client(cloud: str):
+    """
+    Process-wide cached billing client, so long-lived workers reuse one
+    client (and its connection pool) across every job they run.
+    """
+    if cloud not in BILLING_CLIENTS:
+        raise ValueError(f"Unsupported billing cloud: {cloud}")
+    return BILLING_CLIENTS[cloud]()
@@ -0,0 +1,168 @@
+import csv
+import gzip
+import mmap
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from finops.cost_aggregator import CostAggregator
+
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+# lineItem/ProductCode -> platform; anything else is attributed to "aws".
+DEFAULT_PLATFORM_MAP = {
+    "AmazonRedshift": "redshift",
+    "AmazonEKS": "kubernetes",
+    "AmazonEMR": "spark",
+    "AmazonAthena": "athena",
+}
+
+
+class BillingExportError(ValueError):
+    pass
+
+
+class BillingExportImporter:
+    """
+    Bulk import of line-item billing exports (AWS CUR-style CSV, plain or
+    gzip).
+
+    Files are stream-parsed chunk_rows at a time and reduced to one cost
+    record per (platform, job tag) per file, so memory stays bounded by
+    the chunk size and the number of distinct jobs. Uncompressed files are
+    read through mmap. import_files() parses several files in parallel on
+    a process pool and feeds the aggregator's batch path.
+    """
+
+    def __init__(
+        self,
+        job_tag_key: str = "app",
+        cost_column: str = "lineItem/UnblendedCost",
+        product_column: str = "lineItem/ProductCode",
+        platform_map: Optional[Dict[str, str]] = None,
+        default_platform: str = "aws",
+        untagged_job_id: str = "untagged",
+        chunk_rows: int = 50_000,
+        max_workers: Optional[int] = None,
+    ):
+        self.job_tag_column = f"resourceTags/user:{job_tag_key}"
+        self.cost_column = cost_column
+        self.product_column = product_column
+        self.platform_map = DEFAULT_PLATFORM_MAP if platform_map is None else platform_map
+        self.default_platform = default_platform
+        self.untagged_job_id = untagged_job_id
+        self.chunk_rows = chunk_rows
+        self.max_workers = max_workers
+
+    def _iter_rows(self, path: str) -> Iterator[List[str]]:
+        with open(path, "rb") as raw:
+            is_gzip = raw.read(2) == GZIP_MAGIC
+            size = os.fstat(raw.fileno()).st_size
+            raw.seek(0)
+
+            if is_gzip:
+                with gzip.open(raw, "rt", newline="", encoding="utf-8") as text:
+                    yield from csv.reader(text)
+                return
+
+            if size == 0:
+                return
+
+            with mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                lines = (line.decode("utf-8") for line in iter(mm.readline, b""))
+                yield from csv.reader(lines)
+
+    def _column_indexes(self, header: List[str], path: str) -> Tuple[int, int, Optional[int]]:
+        try:
+            cost_idx = header.index(self.cost_column)
+            product_idx = header.index(self.product_column)
+        except ValueError:
+            raise BillingExportError(
+                f"{path}: missing required column {self.cost_column!r} or {self.product_column!r}"
+            )
+        tag_idx = header.index(self.job_tag_column) if self.job_tag_column in header else None
+        return cost_idx, product_idx, tag_idx
+
+    def parse_file(self, path: str) -> Tuple[List[Dict], int]:
+        """
+        Returns (cost records, line items read) for one export file.
+        """
+        rows = self._iter_rows(path)
+        header = next(rows, None)
+        if header is None:
+            return [], 0
+        header[0] = header[0].lstrip("\ufeff")
+        cost_idx, product_idx, tag_idx = self._column_indexes(header, path)
+
+        platform_map = self.platform_map
+        default_platform = self.default_platform
+        untagged = self.untagged_job_id
+        totals: Dict[Tuple[str, str], float] = {}
+        line_items = 0
+
+        while True:
+            chunk = list(islice(rows, self.chunk_rows))
+            if not chunk:
+                break
+            first_row = line_items + 2  # data rows are numbered after the header
+            line_items += len(chunk)
+
+            for row_no, row in enumerate(chunk, first_row):
+                if not row:
+                    continue
+                try:
+                    cost = row[cost_idx]
+                    if not cost:
+                        continue
+                    platform = platform_map.get(row[product_idx], default_platform)
+                    job_id = (row[tag_idx] if tag_idx is not None else "") or untagged
+                    amount = float(cost)
+                except (IndexError, ValueError) as e:
+                    raise BillingExportError(f"{path}: malformed row {row_no}: {e}")
+                key = (platform, job_id)
+                totals[key] = totals.get(key, 0.0) + amount
+
+        records = [
+            {
+                "platform": platform,
+                "job_id": job_id,
+                "estimated_cost_usd": round(cost, 4),
+                "source": os.path.basename(path),
+            }
+            for (platform, job_id), cost in totals.items()
+        ]
+        return records, line_items
+
+    def import_files(self, paths: Iterable[str], aggregator: CostAggregator) -> Dict:
+        paths = list(paths)
+        start = time.perf_counter()
+        records_added = 0
+        line_items = 0
+
+        pool = None
+        if len(paths) > 1 and self.max_workers != 1:
+            pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        try:
+            # Parse every file before touching the aggregator, so a bad file
+            # leaves it unchanged rather than holding a partial import.
+            results = list(pool.map(self.parse_file, paths) if pool else map(self.parse_file, paths))
+        finally:
+            if pool:
+                pool.shutdown()
+
+        for records, count in results:
+            aggregator.add_costs(records)
+            records_added += len(records)
+            line_items += count
+
+        elapsed = time.perf_counter() - start
+        return {
+            "files": len(paths),
+            "line_items": line_items,
+            "records": records_added,
+            "elapsed_sec": round(elapsed, 3),
+            "line_items_per_sec": round(line_items / elapsed, 1) if elapsed > 0 else None,
+        }
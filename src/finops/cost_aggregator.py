@@ -1,5 +1,5 @@
 import statistics
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 
 class CostAggregator:
@@ -8,15 +8,36 @@ class CostAggregator:
         self.anomaly_threshold_pct = anomaly_threshold_pct
         self.cost_center = cost_center
         self.costs: List[Dict] = []
+        # Totals fed by accumulate(), for callers that never build a record dict.
+        self.accumulated_by_platform: Dict[str, float] = {}
 
     def add_cost(self, cost_record: Dict):
         self.costs.append(cost_record)
 
+    def add_costs(self, cost_records: Iterable[Dict]):
+        self.costs.extend(cost_records)
+
+    def accumulate(self, platform: str, estimated_cost_usd: float):
+        self.accumulated_by_platform[platform] = (
+            self.accumulated_by_platform.get(platform, 0.0) + estimated_cost_usd
+        )
+
+    def all_costs(self) -> List[Dict]:
+        """
+        Every cost this aggregator holds: the added records plus one record
+        per platform for accumulated totals.
+        """
+        return self.costs + [
+            {"platform": platform, "estimated_cost_usd": cost, "accumulated": True}
+            for platform, cost in self.accumulated_by_platform.items()
+        ]
+
     def total_cost(self) -> float:
-        return round(sum(c.get("estimated_cost_usd", 0.0) for c in self.costs), 4)
+        total = sum(c.get("estimated_cost_usd", 0.0) for c in self.costs)
+        return round(total + sum(self.accumulated_by_platform.values()), 4)
 
     def cost_by_platform(self) -> Dict[str, float]:
-        result: Dict[str, float] = {}
+        result: Dict[str, float] = dict(self.accumulated_by_platform)
         for c in self.costs:
             p = c.get("platform", "unknown")
             result[p] = result.get(p, 0.0) + float(c.get("estimated_cost_usd", 0.0))
@@ -25,6 +46,11 @@ class CostAggregator:
     def is_budget_breached(self) -> bool:
         return self.job_budget_usd and self.total_cost() > self.job_budget_usd
 
+    def budget_headroom(self) -> Optional[float]:
+        if not self.job_budget_usd:
+            return None
+        return round(self.job_budget_usd - self.total_cost(), 4)
+
     def detect_anomaly(self, historical_costs: Optional[List[float]]) -> bool:
         if not historical_costs or len(historical_costs) < 3:
             return False
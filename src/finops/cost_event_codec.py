@@ -0,0 +1,242 @@
+"""
+Compact binary wire format for batches of cost events.
+
+Layout (little-endian):
+
+    header   : magic b"FCB1" | u32 string_count | u32 record_count
+    strings  : string_count x (u16 byte_len | utf-8 bytes)
+    records  : record_count x RECORD
+
+RECORD fields are indexes into the batch's string table (NO_STRING when
+absent) plus fixed-width numbers:
+
+    platform, id_key, id_value, namespace, cost_center, usage1_key, usage2_key : u32
+    estimated_cost_usd, usage1_value, usage2_value                            : f64
+    timestamp                                                                 : i64
+
+id_key / id_value carry the collector's identifier (job_id, run_id or
+query_id); usage slots carry metrics such as cpu_core_hours or dbu_hours.
+Batches that do not fit this shape are written as JSON behind the
+b"FCJ1" magic instead.
+"""
+
+import json
+import math
+import struct
+from typing import Dict, List, Optional, Tuple, Union
+
+from finops.cost_aggregator import CostAggregator
+
+
+BINARY_MAGIC = b"FCB1"
+JSON_MAGIC = b"FCJ1"
+
+HEADER = struct.Struct("<4sII")
+STRING_LEN = struct.Struct("<H")
+RECORD = struct.Struct("<7I3dq")
+
+NO_STRING = 0xFFFFFFFF
+NO_TIMESTAMP = -(2 ** 63)
+
+_STRING_FIELDS = ("namespace", "cost_center")
+_RESERVED = {"platform", "estimated_cost_usd", "timestamp"} | set(_STRING_FIELDS)
+
+
+class CostEventCodecError(ValueError):
+    pass
+
+
+def _split_event(event: Dict) -> Optional[Tuple]:
+    """
+    Map one collector dict onto the fixed record shape, or None if it
+    does not fit (the batch then falls back to JSON).
+    """
+    platform = event.get("platform")
+    cost = event.get("estimated_cost_usd")
+    timestamp = event.get("timestamp", NO_TIMESTAMP)
+    if not isinstance(platform, str) or type(cost) is not float or type(timestamp) is not int:
+        return None
+
+    strings = []
+    for field in _STRING_FIELDS:
+        # Absent encodes as NO_STRING; an explicit None would decode as
+        # absent, so it is left to the JSON fallback.
+        value = event.get(field)
+        if field in event and not isinstance(value, str):
+            return None
+        strings.append(value)
+
+    id_item = None
+    usages = []
+    for key, value in event.items():
+        if key in _RESERVED:
+            continue
+        if isinstance(value, str) and id_item is None:
+            id_item = (key, value)
+        elif type(value) is float and not math.isnan(value) and len(usages) < 2:
+            usages.append((key, value))
+        else:
+            return None
+
+    return platform, id_item, strings, usages, cost, timestamp
+
+
+def encode_batch(events: List[Dict]) -> bytes:
+    rows = []
+    for event in events:
+        row = _split_event(event)
+        if row is None:
+            return encode_json_batch(events)
+        rows.append(row)
+
+    table: Dict[str, int] = {}
+
+    def intern(value: Optional[str]) -> int:
+        if value is None:
+            return NO_STRING
+        idx = table.get(value)
+        if idx is None:
+            idx = table[value] = len(table)
+        return idx
+
+    body = bytearray(RECORD.size * len(rows))
+    for i, (platform, id_item, strings, usages, cost, timestamp) in enumerate(rows):
+        id_key, id_value = id_item or (None, None)
+        (u1_key, u1_val), (u2_key, u2_val) = (usages + [(None, math.nan)] * 2)[:2]
+        RECORD.pack_into(
+            body,
+            i * RECORD.size,
+            intern(platform),
+            intern(id_key),
+            intern(id_value),
+            intern(strings[0]),
+            intern(strings[1]),
+            intern(u1_key),
+            intern(u2_key),
+            cost,
+            u1_val,
+            u2_val,
+            timestamp,
+        )
+
+    out = bytearray(HEADER.pack(BINARY_MAGIC, len(table), len(rows)))
+    for value in table:
+        raw = value.encode("utf-8")
+        if len(raw) > 0xFFFF:
+            return encode_json_batch(events)
+        out += STRING_LEN.pack(len(raw))
+        out += raw
+    out += body
+    return bytes(out)
+
+
+def encode_json_batch(events: List[Dict]) -> bytes:
+    return JSON_MAGIC + json.dumps(events, separators=(",", ":")).encode("utf-8")
+
+
+def _require(buf: memoryview, offset: int, size: int, what: str):
+    if offset + size > len(buf):
+        raise CostEventCodecError(f"Truncated cost batch: {what} needs {offset + size} bytes, got {len(buf)}")
+
+
+def _read_binary(buf: memoryview) -> Tuple[List[str], memoryview]:
+    _require(buf, 0, HEADER.size, "header")
+    _, string_count, record_count = HEADER.unpack_from(buf, 0)
+    offset = HEADER.size
+
+    strings: List[str] = []
+    for i in range(string_count):
+        _require(buf, offset, STRING_LEN.size, f"string {i} length")
+        (length,) = STRING_LEN.unpack_from(buf, offset)
+        offset += STRING_LEN.size
+        _require(buf, offset, length, f"string {i}")
+        try:
+            strings.append(str(buf[offset:offset + length], "utf-8"))
+        except UnicodeDecodeError as e:
+            raise CostEventCodecError(f"Invalid UTF-8 in cost batch string {i}: {e}")
+        offset += length
+
+    end = offset + record_count * RECORD.size
+    if end != len(buf):
+        raise CostEventCodecError(f"Truncated or oversized cost batch: expected {end} bytes, got {len(buf)}")
+    return strings, buf[offset:end]
+
+
+def _load_json(buf: memoryview) -> List[Dict]:
+    try:
+        events = json.loads(bytes(buf[4:]))
+    except ValueError as e:
+        raise CostEventCodecError(f"Invalid JSON cost batch: {e}")
+    if not isinstance(events, list) or not all(isinstance(e, dict) for e in events):
+        raise CostEventCodecError("JSON cost batch is not a list of event objects")
+    return events
+
+
+def _magic(buf: memoryview) -> bytes:
+    if len(buf) < len(BINARY_MAGIC):
+        raise CostEventCodecError("Cost batch too short")
+    return bytes(buf[:4])
+
+
+def decode_batch(data: Union[bytes, bytearray, memoryview]) -> List[Dict]:
+    """
+    Decode a batch back into the dicts the collectors produce.
+    """
+    buf = memoryview(data)
+    magic = _magic(buf)
+    if magic == JSON_MAGIC:
+        return _load_json(buf)
+    if magic != BINARY_MAGIC:
+        raise CostEventCodecError(f"Unknown cost batch magic: {magic!r}")
+
+    strings, records = _read_binary(buf)
+    events = []
+    rows = RECORD.iter_unpack(records)
+    try:
+        for platform, id_key, id_value, namespace, cost_center, u1_key, u2_key, cost, u1, u2, ts in rows:
+            event = {"platform": strings[platform]}
+            if id_key != NO_STRING:
+                event[strings[id_key]] = strings[id_value]
+            if namespace != NO_STRING:
+                event["namespace"] = strings[namespace]
+            if cost_center != NO_STRING:
+                event["cost_center"] = strings[cost_center]
+            if u1_key != NO_STRING:
+                event[strings[u1_key]] = u1
+            if u2_key != NO_STRING:
+                event[strings[u2_key]] = u2
+            event["estimated_cost_usd"] = cost
+            if ts != NO_TIMESTAMP:
+                event["timestamp"] = ts
+            events.append(event)
+    except IndexError:
+        raise CostEventCodecError(f"Cost batch record {len(events)} references a missing string")
+    return events
+
+
+def feed_aggregator(data: Union[bytes, bytearray, memoryview], aggregator: CostAggregator) -> int:
+    """
+    Accumulate a batch straight into `aggregator` without building event
+    dicts. Binary batches are read in place from a memoryview; JSON
+    fallback batches go through add_cost. Returns the number of events.
+    """
+    buf = memoryview(data)
+    magic = _magic(buf)
+    if magic == JSON_MAGIC:
+        events = _load_json(buf)
+        for event in events:
+            aggregator.add_cost(event)
+        return len(events)
+    if magic != BINARY_MAGIC:
+        raise CostEventCodecError(f"Unknown cost batch magic: {magic!r}")
+
+    strings, records = _read_binary(buf)
+    by_platform: Dict[int, float] = {}
+    for row in RECORD.iter_unpack(records):
+        by_platform[row[0]] = by_platform.get(row[0], 0.0) + row[7]
+
+    if any(idx >= len(strings) for idx in by_platform):
+        raise CostEventCodecError("Cost batch record references a missing platform string")
+    for platform_idx, cost in by_platform.items():
+        aggregator.accumulate(strings[platform_idx], cost)
+    return len(records) // RECORD.size
@@ -18,6 +18,7 @@ from finops.billing_api_integrations import (
     AWSCostExplorerClient,
     GCPBillingClient,
     AzureCostManagementClient,
+    get_billing_client,
 )
 
 
@@ -46,7 +47,7 @@ class FinOpsOrchestrator:
         aws_tag_value: Optional[str] = None,
     ):
         if aws_tag_key and aws_tag_value:
-            aws = AWSCostExplorerClient()
+            aws = get_billing_client("aws")
             aws_costs = aws.get_daily_cost(
                 start_date="2026-01-01",
                 end_date="2026-01-02",
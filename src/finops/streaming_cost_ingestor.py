@@ -3,6 +3,7 @@ import time
 from typing import Dict, List, Optional
 
 from finops.cost_aggregator import CostAggregator
+from finops.cost_event_codec import feed_aggregator
 
 
 class StreamingCostIngestor:
@@ -25,7 +26,17 @@ class StreamingCostIngestor:
 
     def ingest_event(self, cost_event: Dict) -> Dict:
         self.aggregator.add_cost(cost_event)
+        return self._record_summary()
 
+    def ingest_batch(self, payload: bytes) -> Dict:
+        """
+        Ingest one encoded batch (see finops.cost_event_codec) and return
+        a single summary for it.
+        """
+        feed_aggregator(payload, self.aggregator)
+        return self._record_summary()
+
+    def _record_summary(self) -> Dict:
         total = self.aggregator.total_cost()
         self.historical_costs.append(total)
         if len(self.historical_costs) > 20:
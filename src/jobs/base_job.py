@@ -1,9 +1,12 @@
 import time
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 from config_loader import ConfigLoader
+from finops.cost_aggregator import CostAggregator
+from finops.k8s_cost_collector import K8sCostCollector
 from utils.logger import get_logger
+from utils.resource_sampler import ResourceSampler
 
 
 class BaseJob(ABC):
@@ -16,8 +19,9 @@ class BaseJob(ABC):
         remote_backend: Optional[str] = None,
         remote_table: Optional[str] = None,
         remote_key: Optional[str] = None,
+        config: Optional[ConfigLoader] = None,
     ):
-        self.config = ConfigLoader(
+        self.config = config or ConfigLoader(
             config_path=config_path,
             experiment_id=experiment_id,
             user_id=user_id,
@@ -32,13 +36,27 @@ class BaseJob(ABC):
             job_id=self.config.get_job_id(),
         )
 
+        self.job_id = self.config.get_job_id() or job_name
+        self.cost_aggregator = CostAggregator(
+            job_budget_usd=self.config.get_job_budget_usd(),
+            anomaly_threshold_pct=self.config.get_anomaly_threshold_pct(),
+            cost_center=self.config.get_cost_center(),
+        )
+        self.cost_collector = K8sCostCollector()
+        self.resource_sampler = ResourceSampler(
+            interval_sec=self.config.get_self_metering_interval_sec(),
+        )
+
         self.start_time = None
+        self.self_cost_record: Optional[Dict] = None
         self.rows_processed = 0
         self.gb_processed = 0.0
         self.tables: List[str] = []
 
     def execute(self):
         self.start_time = time.time()
+        self.self_cost_record = None
+        self.resource_sampler.start()
         try:
             self.logger.info("Job started")
             self.pre_run()
@@ -70,12 +88,34 @@ class BaseJob(ABC):
         self.gb_processed = gb_processed
         self.tables = tables or []
 
+    def _record_self_cost(self) -> Dict:
+        # _finalize can run twice for one execute() (success path raises,
+        # failure path runs); bill the run only once.
+        if self.self_cost_record is not None:
+            return self.self_cost_record
+
+        usage = self.resource_sampler.stop()
+        cost_record = self.cost_collector.estimate_job_cost(
+            job_label=self.job_id,
+            namespace=self.config.get_k8s_namespace(),
+            cpu_core_hours=usage["cpu_core_hours"],
+            memory_gb_hours=usage["memory_gb_hours"],
+        )
+        cost_record["cost_center"] = self.cost_aggregator.cost_center
+        self.cost_aggregator.add_cost(cost_record)
+        self.self_cost_record = cost_record
+        return cost_record
+
     def _finalize(self, success: bool):
         runtime = round(time.time() - self.start_time, 2)
+        cost_record = self._record_self_cost()
         self.logger.info(
             f"Job completed success={success} runtime_sec={runtime}",
             metrics={
                 "rows": self.rows_processed,
                 "gb": self.gb_processed,
+                "cpu_core_hours": cost_record["cpu_core_hours"],
+                "memory_gb_hours": cost_record["memory_gb_hours"],
+                "estimated_cost_usd": cost_record["estimated_cost_usd"],
             },
         )
@@ -0,0 +1,205 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Type
+
+from config_loader import ConfigLoader
+from finops.cost_aggregator import CostAggregator
+from jobs.base_job import BaseJob
+from utils.logger import get_logger
+
+
+_WORKER_CONFIGS: Dict[str, ConfigLoader] = {}
+
+
+def _init_worker(configs: Dict[str, ConfigLoader]):
+    _WORKER_CONFIGS.update(configs)
+
+
+def _run_job(job_cls: Type[BaseJob], config_path: str, job_name: str) -> Dict:
+    job = None
+    try:
+        job = job_cls(
+            config_path=config_path,
+            job_name=job_name,
+            config=_WORKER_CONFIGS.get(config_path),
+        )
+        job.execute()
+        success = True
+    except Exception:
+        success = False
+
+    return {
+        "job_name": job_name,
+        "job_id": job.job_id if job else job_name,
+        "success": success,
+        "costs": job.cost_aggregator.all_costs() if job else [],
+    }
+
+
+class ParallelJobRunner:
+    """
+    Runs many BaseJob subclasses on a shared process pool.
+
+    Configs are parsed once in the parent and shipped to each worker at
+    start-up; billing clients are cached per worker process. Jobs are
+    scheduled by projected cost-center budget headroom: spend so far plus
+    the average job cost for every running job and the one about to start.
+    Until a cost center has a finished job to estimate from, it runs one
+    job at a time. Jobs whose cost center would end up within
+    min_headroom_pct of its budget are held back.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        cost_center_budgets: Optional[Dict[str, float]] = None,
+        anomaly_threshold_pct: float = 200,
+        min_headroom_pct: float = 10.0,
+    ):
+        self.max_workers = max_workers
+        self.cost_center_budgets = cost_center_budgets or {}
+        self.anomaly_threshold_pct = anomaly_threshold_pct
+        self.min_headroom_pct = min_headroom_pct
+        self.logger = get_logger(name="parallel_job_runner")
+        self._reset()
+
+    def _reset(self):
+        # Spend and scheduling state are per batch: each run() starts fresh.
+        self.cost_centers: Dict[Optional[str], CostAggregator] = {}
+        self.running: Dict[Optional[str], int] = {}
+        self.completed: Dict[Optional[str], int] = {}
+        self.batch_aggregator = CostAggregator(
+            job_budget_usd=sum(self.cost_center_budgets.values()) or None,
+            anomaly_threshold_pct=self.anomaly_threshold_pct,
+            cost_center=None,
+        )
+
+    def _cost_center_aggregator(self, cost_center: Optional[str]) -> CostAggregator:
+        if cost_center not in self.cost_centers:
+            self.cost_centers[cost_center] = CostAggregator(
+                job_budget_usd=self.cost_center_budgets.get(cost_center),
+                anomaly_threshold_pct=self.anomaly_threshold_pct,
+                cost_center=cost_center,
+            )
+        return self.cost_centers[cost_center]
+
+    def _headroom_pct(self, cost_center: Optional[str]) -> float:
+        agg = self._cost_center_aggregator(cost_center)
+        headroom = agg.budget_headroom()
+        if headroom is None:
+            return float("inf")
+
+        running = self.running.get(cost_center, 0)
+        completed = self.completed.get(cost_center, 0)
+        if not completed:
+            if running:
+                # No cost estimate yet: wait for the first job to finish.
+                return float("-inf")
+            projected = 0.0
+        else:
+            projected = agg.total_cost() / completed * (running + 1)
+
+        return (headroom - projected) / agg.job_budget_usd * 100
+
+    def _next_job(self, pending: List[Dict]) -> Optional[Dict]:
+        if not pending:
+            return None
+        pending.sort(key=lambda j: self._headroom_pct(j["cost_center"]), reverse=True)
+        if self._headroom_pct(pending[0]["cost_center"]) <= self.min_headroom_pct:
+            return None
+        return pending.pop(0)
+
+    def run(self, jobs: List[Dict], historical_costs: Optional[List[float]] = None) -> Dict:
+        """
+        jobs: [{"job_cls": MyJob, "config_path": "config.yaml", "job_name": "my-job"}, ...]
+        """
+        self._reset()
+        configs = {
+            path: ConfigLoader(config_path=path)
+            for path in {j["config_path"] for j in jobs}
+        }
+        pending = [
+            {**j, "cost_center": configs[j["config_path"]].get_cost_center()}
+            for j in jobs
+        ]
+        results: List[Dict] = []
+        in_flight = {}
+        slots = self.max_workers or os.cpu_count() or 1
+
+        def new_pool():
+            return ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(configs,),
+            )
+
+        pool = new_pool()
+        try:
+            while pending or in_flight:
+                while len(in_flight) < slots:
+                    job = self._next_job(pending)
+                    if job is None:
+                        break
+                    future = pool.submit(_run_job, job["job_cls"], job["config_path"], job["job_name"])
+                    in_flight[future] = job
+                    self.running[job["cost_center"]] = self.running.get(job["cost_center"], 0) + 1
+
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                pool_broken = False
+                for future in done:
+                    job = in_flight.pop(future)
+                    self.running[job["cost_center"]] -= 1
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        # Worker died or the job could not be shipped to it.
+                        pool_broken = pool_broken or isinstance(e, BrokenProcessPool)
+                        self.logger.error(
+                            f"Job lost in worker job_name={job['job_name']}: {e!r}",
+                            context={"cost_center": job["cost_center"]},
+                        )
+                        results.append(
+                            {"job_name": job["job_name"], "job_id": job["job_name"], "success": False, "costs": []}
+                        )
+                        continue
+
+                    self.completed[job["cost_center"]] = self.completed.get(job["cost_center"], 0) + 1
+                    for cost in result["costs"]:
+                        self._cost_center_aggregator(job["cost_center"]).add_cost(cost)
+                        self.batch_aggregator.add_cost(cost)
+                    results.append(result)
+
+                if pool_broken:
+                    # Every in-flight job failed with the pool; start a new
+                    # one for whatever is still pending.
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    pool = new_pool()
+        finally:
+            pool.shutdown()
+
+        for job in pending:
+            self.logger.warning(
+                f"Job held back: cost center near budget job_name={job['job_name']}",
+                context={"cost_center": job["cost_center"]},
+            )
+
+        return self._batch_summary(results, pending, historical_costs)
+
+    def _batch_summary(
+        self,
+        results: List[Dict],
+        held_back: List[Dict],
+        historical_costs: Optional[List[float]],
+    ) -> Dict:
+        summary = self.batch_aggregator.executive_summary(historical_costs)
+        summary["cost_by_cost_center"] = {
+            cc: agg.total_cost() for cc, agg in self.cost_centers.items()
+        }
+        summary["jobs_succeeded"] = sorted(r["job_name"] for r in results if r["success"])
+        summary["jobs_failed"] = sorted(r["job_name"] for r in results if not r["success"])
+        summary["jobs_held_back"] = sorted(j["job_name"] for j in held_back)
+        return summary
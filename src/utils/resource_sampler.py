@@ -0,0 +1,92 @@
+import os
+import sys
+import threading
+import time
+from typing import Dict, Optional
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+PROC_STATM = "/proc/self/statm"
+
+
+class ResourceSampler:
+    """
+    Low-overhead CPU / memory sampler for the current process.
+
+    CPU time is read once at start and stop (process_time covers every
+    thread). Resident memory is sampled on a daemon thread and integrated
+    over wall time into GB-hours.
+    """
+
+    def __init__(self, interval_sec: float = 5.0):
+        self.interval_sec = interval_sec
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._cpu_start = 0.0
+        self._wall_start = 0.0
+        self._last_sample_at = 0.0
+        self._last_rss_gb = 0.0
+        self._memory_gb_sec = 0.0
+        self._peak_rss_gb = 0.0
+
+    def start(self):
+        self._stop_event.clear()
+        self._cpu_start = time.process_time()
+        self._wall_start = time.monotonic()
+        self._last_sample_at = self._wall_start
+        self._last_rss_gb = self._read_rss_gb()
+        self._peak_rss_gb = self._last_rss_gb
+        self._memory_gb_sec = 0.0
+
+        self._thread = threading.Thread(target=self._loop, name="resource-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Dict:
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        self._sample()
+
+        cpu_sec = time.process_time() - self._cpu_start
+        return {
+            "cpu_core_hours": cpu_sec / 3600,
+            "memory_gb_hours": self._memory_gb_sec / 3600,
+            "peak_rss_gb": round(self._peak_rss_gb, 4),
+            "wall_sec": round(time.monotonic() - self._wall_start, 2),
+        }
+
+    def _loop(self):
+        while not self._stop_event.wait(self.interval_sec):
+            self._sample()
+
+    def _sample(self):
+        rss_gb = self._read_rss_gb()
+        now = time.monotonic()
+        with self._lock:
+            elapsed = now - self._last_sample_at
+            self._memory_gb_sec += (self._last_rss_gb + rss_gb) / 2 * elapsed
+            self._last_sample_at = now
+            self._last_rss_gb = rss_gb
+            self._peak_rss_gb = max(self._peak_rss_gb, rss_gb)
+
+    @staticmethod
+    def _read_rss_gb() -> float:
+        try:
+            with open(PROC_STATM) as f:
+                pages = int(f.read().split()[1])
+            return pages * os.sysconf("SC_PAGE_SIZE") / 1024 ** 3
+        except (OSError, ValueError, IndexError):
+            pass
+
+        # No procfs: fall back to peak RSS, whose units differ by platform.
+        if resource and sys.platform == "darwin":
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024 ** 3
+        if resource and sys.platform.startswith("linux"):
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024 ** 2
+
+        return 0.0
@@ -0,0 +1,73 @@
+import time
+
+import pytest
+
+from jobs.base_job import BaseJob
+from utils import resource_sampler
+from utils.resource_sampler import ResourceSampler
+
+
+class BusyJob(BaseJob):
+    def run(self):
+        sum(i * i for i in range(200_000))
+
+
+def test_execute_records_self_cost(tmp_path):
+    cfg = tmp_path / "config.yaml"
+    cfg.write_text("job:\n  id: busy-job\n  cost_center: SBE\n")
+
+    job = BusyJob(config_path=str(cfg), job_name="busy")
+    job.execute()
+
+    [record] = job.cost_aggregator.costs
+    assert record["platform"] == "kubernetes"
+    assert record["job_id"] == "busy-job"
+    assert record["cost_center"] == "SBE"
+    assert job.cost_aggregator.total_cost() == record["estimated_cost_usd"]
+
+
+def test_resource_sampler_measures_cpu_and_memory():
+    sampler = ResourceSampler(interval_sec=0.05)
+    sampler.start()
+    deadline = time.process_time() + 0.2
+    while time.process_time() < deadline:
+        pass
+    usage = sampler.stop()
+
+    assert usage["cpu_core_hours"] >= 0.2 / 3600 * 0.9
+    assert usage["memory_gb_hours"] > 0
+    assert usage["peak_rss_gb"] > 0
+
+
+def test_self_cost_recorded_once_when_finalize_fails(tmp_path):
+    cfg = tmp_path / "config.yaml"
+    cfg.write_text("job:\n  id: busy-job\n  cost_center: SBE\n")
+    job = BusyJob(config_path=str(cfg), job_name="busy-finalize")
+
+    info = job.logger.info
+
+    def failing_info(msg, *args, **kwargs):
+        if msg.startswith("Job completed success=True"):
+            raise RuntimeError("log sink down")
+        return info(msg, *args, **kwargs)
+
+    job.logger.info = failing_info
+    with pytest.raises(RuntimeError):
+        job.execute()
+
+    assert len(job.cost_aggregator.costs) == 1
+
+
+def test_rss_fallback_units(monkeypatch):
+    monkeypatch.setattr(resource_sampler, "PROC_STATM", "/nonexistent/statm")
+    one_gb_rusage = type("Usage", (), {"ru_maxrss": 1024 ** 3})
+    monkeypatch.setattr(resource_sampler.resource, "getrusage", lambda who: one_gb_rusage)
+
+    monkeypatch.setattr(resource_sampler.sys, "platform", "darwin")  # bytes
+    assert ResourceSampler._read_rss_gb() == 1.0
+
+    monkeypatch.setattr(resource_sampler.sys, "platform", "linux")  # KB
+    assert ResourceSampler._read_rss_gb() == 1024.0
+
+    monkeypatch.setattr(resource_sampler.sys, "platform", "sunos5")
+    assert ResourceSampler._read_rss_gb() == 0.0
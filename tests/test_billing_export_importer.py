@@ -0,0 +1,63 @@
+import gzip
+import os
+import shutil
+
+import pytest
+
+from finops.billing_export_importer import BillingExportError, BillingExportImporter
+from finops.cost_aggregator import CostAggregator
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "cur_sample.csv")
+
+
+def test_parse_plain_and_gzip_match(tmp_path):
+    gz_path = tmp_path / "cur_sample.csv.gz"
+    with open(FIXTURE, "rb") as src, gzip.open(gz_path, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+
+    importer = BillingExportImporter(job_tag_key="app", chunk_rows=4)
+    plain, plain_rows = importer.parse_file(FIXTURE)
+    packed, packed_rows = importer.parse_file(str(gz_path))
+
+    assert plain_rows == packed_rows == 16
+    by_key = {(r["platform"], r["job_id"]): r["estimated_cost_usd"] for r in plain}
+    assert by_key == {(r["platform"], r["job_id"]): r["estimated_cost_usd"] for r in packed}
+    assert by_key[("redshift", "finance-dwh")] == 312.96
+    assert by_key[("aws", "untagged")] == 13.9
+    assert by_key[("kubernetes", "ml-feature-store")] == 4.8
+
+
+def test_import_files_in_parallel_feeds_aggregator(tmp_path):
+    copy = tmp_path / "cur_sample_copy.csv"
+    shutil.copyfile(FIXTURE, copy)
+
+    agg = CostAggregator(None, 150, "SBE")
+    stats = BillingExportImporter(max_workers=2).import_files([FIXTURE, str(copy)], agg)
+
+    assert stats["files"] == 2
+    assert stats["line_items"] == 32
+    single, _ = BillingExportImporter().parse_file(FIXTURE)
+    assert agg.total_cost() == round(2 * sum(r["estimated_cost_usd"] for r in single), 4)
+
+
+def test_malformed_rows_name_file_and_row(tmp_path):
+    with open(FIXTURE) as f:
+        header = f.readline()
+
+    for bad_row in ("li-x,2026-01-01,Usage,AmazonEC2,Box,1,not-a-number,etl\n", "li-x,2026-01-01\n"):
+        path = tmp_path / "bad.csv"
+        path.write_text(header + "li-1,2026-01-01,Usage,AmazonEC2,Box,1,1.5,etl\n" + bad_row)
+
+        with pytest.raises(BillingExportError, match=r"bad\.csv: malformed row 3"):
+            BillingExportImporter().parse_file(str(path))
+
+
+def test_failed_import_leaves_aggregator_untouched(tmp_path):
+    bad = tmp_path / "bad.csv"
+    bad.write_text("lineItem/ProductCode,lineItem/UnblendedCost\nAmazonEC2,oops\n")
+
+    agg = CostAggregator(None, 150, "SBE")
+    with pytest.raises(BillingExportError):
+        BillingExportImporter(max_workers=2).import_files([FIXTURE, str(bad)], agg)
+
+    assert agg.costs == []
@@ -6,3 +6,14 @@ def test_total_cost():
     agg.add_cost({"estimated_cost_usd": 10})
     agg.add_cost({"estimated_cost_usd": 20})
     assert agg.total_cost() == 30
+
+
+def test_all_costs_includes_accumulated_totals():
+    agg = CostAggregator(100, 150, "SBE")
+    agg.add_cost({"platform": "aws", "estimated_cost_usd": 10.0})
+    agg.accumulate("databricks", 7.5)
+
+    merged = CostAggregator(100, 150, "SBE")
+    merged.add_costs(agg.all_costs())
+    assert merged.total_cost() == agg.total_cost() == 17.5
+    assert merged.cost_by_platform() == agg.cost_by_platform()
@@ -0,0 +1,94 @@
+import struct
+
+import pytest
+
+from finops.azure_cost_collectors import AzureSynapseCostCollector, FabricCostCollector
+from finops.cloud_cost_collector import DatabricksCostCollector, SnowflakeCostCollector
+from finops.cost_aggregator import CostAggregator
+from finops.cost_event_codec import (
+    BINARY_MAGIC,
+    HEADER,
+    JSON_MAGIC,
+    RECORD,
+    CostEventCodecError,
+    decode_batch,
+    encode_batch,
+    feed_aggregator,
+)
+from finops.k8s_cost_collector import K8sCostCollector
+from finops.warehouse_cost_collectors import BigQueryCostCollector, RedshiftCostCollector
+
+
+def _collector_events():
+    return [
+        K8sCostCollector().estimate_job_cost("etl-job", "etl", 12.5, 48.0),
+        SnowflakeCostCollector().estimate_query_cost("q-1", 1.75),
+        DatabricksCostCollector().estimate_job_cost("run-9", 3.2),
+        BigQueryCostCollector().estimate_query_cost("bq-job", 0.4),
+        RedshiftCostCollector().estimate_query_cost("rs-q", 2.0),
+        AzureSynapseCostCollector().estimate_spark_cost("syn-job", 6.0),
+        FabricCostCollector().estimate_job_cost("fab-job", 10.0),
+        {"platform": "aws", "job_id": "etl-job", "estimated_cost_usd": 21.37},
+        {**K8sCostCollector().estimate_job_cost("etl-job", "etl", 1.0, 2.0), "cost_center": "SBE"},
+    ]
+
+
+def test_binary_round_trip_matches_collector_dicts():
+    events = _collector_events()
+    payload = encode_batch(events)
+
+    assert payload[:4] == BINARY_MAGIC
+    assert decode_batch(memoryview(payload)) == events
+
+
+def test_unsupported_shape_falls_back_to_json():
+    events = _collector_events() + [{"platform": "gcp", "estimated_cost_usd": 5, "labels": {"team": "x"}}]
+    payload = encode_batch(events)
+
+    assert payload[:4] == JSON_MAGIC
+    assert decode_batch(payload) == events
+
+
+def test_none_string_field_falls_back_to_json():
+    events = [{"platform": "aws", "job_id": "a", "namespace": None, "estimated_cost_usd": 1.0}]
+    payload = encode_batch(events)
+
+    assert payload[:4] == JSON_MAGIC
+    assert decode_batch(payload) == events
+
+
+def test_feed_aggregator_matches_add_cost():
+    events = _collector_events()
+    expected = CostAggregator(None, 150, "SBE")
+    for e in events:
+        expected.add_cost(e)
+
+    agg = CostAggregator(None, 150, "SBE")
+    assert feed_aggregator(encode_batch(events), agg) == len(events)
+
+    assert agg.costs == []
+    assert agg.total_cost() == expected.total_cost()
+    assert agg.cost_by_platform() == expected.cost_by_platform()
+
+
+def test_malformed_batches_raise_codec_error():
+    payload = encode_batch(_collector_events())
+    bad_index = HEADER.pack(BINARY_MAGIC, 0, 1) + RECORD.pack(5, *[0xFFFFFFFF] * 6, 1.0, 0.0, 0.0, 0)
+
+    broken = [
+        b"FCB",
+        b"FCB1\x00",
+        payload[: HEADER.size + 3],
+        payload[:-1],
+        HEADER.pack(BINARY_MAGIC, 1, 0) + struct.pack("<H", 2) + b"\xff\xfe",
+        bad_index,
+        b"FCJ1{not json",
+        b"FCJ1{}",
+        b"FCJ1[1,2]",
+        b"XXXX",
+    ]
+    for data in broken:
+        with pytest.raises(CostEventCodecError):
+            decode_batch(data)
+        with pytest.raises(CostEventCodecError):
+            feed_aggregator(data, CostAggregator(None, 150, "SBE"))
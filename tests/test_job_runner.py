@@ -0,0 +1,132 @@
+import os
+
+from finops.cost_event_codec import encode_batch, feed_aggregator
+from jobs.base_job import BaseJob
+from jobs.job_runner import ParallelJobRunner
+
+
+class WarehouseJob(BaseJob):
+    def run(self):
+        self.cost_aggregator.add_cost(
+            {"platform": "snowflake", "job_id": self.job_id, "estimated_cost_usd": 5.0}
+        )
+
+
+class StreamedBatchJob(BaseJob):
+    def run(self):
+        payload = encode_batch(
+            [
+                {"platform": "databricks", "run_id": "r-1", "estimated_cost_usd": 5.0},
+                {"platform": "databricks", "run_id": "r-2", "estimated_cost_usd": 2.5},
+            ]
+        )
+        feed_aggregator(payload, self.cost_aggregator)
+
+
+class CrashingJob(BaseJob):
+    def run(self):
+        os._exit(1)
+
+
+class BrokenJob(BaseJob):
+    def __init__(self, *args, **kwargs):
+        raise RuntimeError("bad job wiring")
+
+    def run(self):
+        pass
+
+
+def test_runner_holds_back_jobs_near_budget(tmp_path):
+    cfg = tmp_path / "config.yaml"
+    cfg.write_text("job:\n  id: warehouse-job\n  cost_center: SBE\n")
+
+    runner = ParallelJobRunner(max_workers=1, cost_center_budgets={"SBE": 5.2})
+    summary = runner.run(
+        [
+            {"job_cls": WarehouseJob, "config_path": str(cfg), "job_name": "wh-1"},
+            {"job_cls": WarehouseJob, "config_path": str(cfg), "job_name": "wh-2"},
+        ]
+    )
+
+    assert len(summary["jobs_succeeded"]) == 1
+    assert len(summary["jobs_held_back"]) == 1
+    assert summary["cost_by_platform"]["snowflake"] == 5.0
+    assert summary["cost_by_cost_center"]["SBE"] >= 5.0
+
+
+def test_constructor_failure_is_reported_not_fatal(tmp_path):
+    cfg = tmp_path / "config.yaml"
+    cfg.write_text("job:\n  id: warehouse-job\n  cost_center: SBE\n")
+
+    summary = ParallelJobRunner(max_workers=2).run(
+        [
+            {"job_cls": BrokenJob, "config_path": str(cfg), "job_name": "broken"},
+            {"job_cls": WarehouseJob, "config_path": str(cfg), "job_name": "wh-1"},
+        ]
+    )
+
+    assert summary["jobs_failed"] == ["broken"]
+    assert summary["jobs_succeeded"] == ["wh-1"]
+
+
+def test_runner_counts_running_jobs_against_budget(tmp_path):
+    cfg = tmp_path / "config.yaml"
+    cfg.write_text("job:\n  id: warehouse-job\n  cost_center: SBE\n")
+    jobs = [
+        {"job_cls": WarehouseJob, "config_path": str(cfg), "job_name": f"wh-{i}"}
+        for i in range(4)
+    ]
+
+    summary = ParallelJobRunner(max_workers=4, cost_center_budgets={"SBE": 5.2}).run(jobs)
+    assert len(summary["jobs_succeeded"]) == 1
+    assert len(summary["jobs_held_back"]) == 3
+    assert not summary["budget_breached"]
+
+    summary = ParallelJobRunner(max_workers=4, cost_center_budgets={"SBE": 12.0}).run(jobs)
+    assert len(summary["jobs_succeeded"]) == 2
+    assert len(summary["jobs_held_back"]) == 2
+    assert not summary["budget_breached"]
+
+
+def test_runner_includes_accumulated_batch_costs(tmp_path):
+    cfg = tmp_path / "config.yaml"
+    cfg.write_text("job:\n  id: streamed-job\n  cost_center: SBE\n")
+
+    summary = ParallelJobRunner(max_workers=1).run(
+        [{"job_cls": StreamedBatchJob, "config_path": str(cfg), "job_name": "streamed"}]
+    )
+
+    assert summary["cost_by_platform"]["databricks"] == 7.5
+    assert summary["total_cost_usd"] >= 7.5
+    assert summary["cost_by_cost_center"]["SBE"] >= 7.5
+
+
+def test_runner_state_is_per_batch(tmp_path):
+    cfg = tmp_path / "config.yaml"
+    cfg.write_text("job:\n  id: warehouse-job\n  cost_center: SBE\n")
+    runner = ParallelJobRunner(max_workers=1, cost_center_budgets={"SBE": 6.0})
+
+    first = runner.run([{"job_cls": WarehouseJob, "config_path": str(cfg), "job_name": "a"}])
+    second = runner.run([{"job_cls": WarehouseJob, "config_path": str(cfg), "job_name": "b"}])
+
+    assert first["jobs_succeeded"] == ["a"]
+    assert second["jobs_succeeded"] == ["b"]
+    assert second["jobs_held_back"] == []
+    assert second["total_cost_usd"] == first["total_cost_usd"]
+
+
+def test_worker_crash_is_reported_not_fatal(tmp_path):
+    cfg = tmp_path / "config.yaml"
+    cfg.write_text("job:\n  id: warehouse-job\n  cost_center: SBE\n")
+
+    summary = ParallelJobRunner(max_workers=1).run(
+        [
+            {"job_cls": WarehouseJob, "config_path": str(cfg), "job_name": "wh-1"},
+            {"job_cls": CrashingJob, "config_path": str(cfg), "job_name": "crash"},
+            {"job_cls": WarehouseJob, "config_path": str(cfg), "job_name": "wh-2"},
+        ]
+    )
+
+    assert summary["jobs_failed"] == ["crash"]
+    assert summary["jobs_succeeded"] == ["wh-1", "wh-2"]
+    assert summary["cost_by_platform"]["snowflake"] == 10.0
@@ -0,0 +1,31 @@
+from finops.cost_event_codec import encode_batch
+from finops.streaming_cost_ingestor import StreamingCostIngestor
+
+
+def _batch(n):
+    return encode_batch(
+        [
+            {"platform": "databricks", "run_id": f"r-{n}", "dbu_hours": 2.0, "estimated_cost_usd": 1.1},
+            {"platform": "snowflake", "query_id": f"q-{n}", "credits_used": 0.3, "estimated_cost_usd": 0.9},
+        ]
+    )
+
+
+def test_ingest_batch_summary_and_history_window():
+    ingestor = StreamingCostIngestor(job_budget_usd=30.0, anomaly_threshold_pct=150, cost_center="SBE")
+
+    summary = ingestor.ingest_batch(_batch(0))
+    assert summary["total_cost_usd"] == 2.0
+    assert summary["cost_by_platform"] == {"databricks": 1.1, "snowflake": 0.9}
+    assert summary["cost_center"] == "SBE"
+    assert not summary["budget_breached"]
+    assert ingestor.historical_costs == [2.0]
+
+    for n in range(1, 21):
+        summary = ingestor.ingest_batch(_batch(n))
+
+    assert summary["total_cost_usd"] == 42.0
+    assert summary["budget_breached"]
+    assert len(ingestor.historical_costs) == 20
+    assert ingestor.historical_costs[0] == 4.0
+    assert ingestor.historical_costs[-1] == 42.0
@@ -0,0 +1,30 @@
+import os
+import sys
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "benchmarks"))
+
+from synthetic_workload import SyntheticCostWorkload  # noqa: E402
+
+
+def test_same_seed_is_deterministic():
+    a = list(SyntheticCostWorkload(seed=7).events(5_000))
+    b = list(SyntheticCostWorkload(seed=7).events(5_000))
+    c = list(SyntheticCostWorkload(seed=8).events(5_000))
+
+    assert a == b
+    assert a != c
+
+
+def test_late_duplicate_rates_and_skew():
+    workload = SyntheticCostWorkload(seed=42, late_pct=2.0, duplicate_pct=1.0)
+    events = list(workload.events(50_000))
+
+    assert 1.5 <= workload.late_events / len(events) * 100 <= 2.5
+    assert 0.7 <= workload.duplicate_events / len(events) * 100 <= 1.3
+    assert len(events) - len({e["event_id"] for e in events}) == workload.duplicate_events
+
+    jobs = Counter(e["job_id"] for e in events)
+    assert jobs["job-00000"] > 20 * jobs["job-04999"] + 20
+    platforms = Counter(e["platform"] for e in events).most_common()
+    assert platforms[0][0] == "kubernetes"